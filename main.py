@@ -3,73 +3,267 @@ import sys
 import os
 import subprocess
 import zipfile
-import io
 import shutil
+import tempfile
+import json
+import hashlib
 import platform
-import requests  # pip install requests
+import time
+import functools
+import urllib.request
+import urllib.error
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QProgressBar, QRadioButton, QFileDialog, QTextEdit
+    QPushButton, QProgressBar, QRadioButton, QCheckBox, QFileDialog, QTextEdit
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtCore import Qt, QThread, QObject, QSettings, QRunnable, QThreadPool, pyqtSignal
 import yt_dlp
 
+# Errors from reusing cached info that warrant a fresh extraction, as in
+# YoutubeDL.download_with_info_file (ReExtractInfo is missing in older yt-dlp)
+_REEXTRACT_ERRORS = tuple(filter(None, (
+    yt_dlp.utils.DownloadError, getattr(yt_dlp.utils, 'ReExtractInfo', None))))
+
+# Paths are resolved once at import time
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_FFMPEG_DIR = os.path.join(_SCRIPT_DIR, "scripts")
+_FFMPEG_PATH = os.path.join(_FFMPEG_DIR, "ffmpeg.exe")
+
+# How long (seconds) fetched video info is reused for downloads; the media
+# URLs in it eventually expire
+INFO_CACHE_TTL = 30 * 60
+
+# Cap on simultaneous downloads when several URLs are entered
+MAX_CONCURRENT_DOWNLOADS = min(4, os.cpu_count() or 1)
+
+# NVIDIA hardware encoders and their tuning flags, in order of preference
+NVENC_ENCODERS = {
+    'h264_nvenc': ['-preset', 'p4', '-rc', 'vbr', '-cq', '23'],
+    'hevc_nvenc': ['-preset', 'p5'],
+}
+
+# Decode on the GPU and keep frames in GPU memory for the NVENC encoder
+CUDA_DECODE_ARGS = ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_can_encode(ffmpeg_path, encoder):
+    """
+    Return True if ffmpeg can actually open the given video encoder. A one-frame
+    test encode is used because builds list NVENC even without an NVIDIA GPU.
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1", "-frames:v", "1",
+             "-c:v", encoder, "-f", "null", "-"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+def _read_ffmpeg_cache_info(info_path):
+    """
+    Read the validators (ETag / Last-Modified) and file size recorded for a
+    previously downloaded ffmpeg.exe. Returns a dict, or None if unavailable.
+    """
+    try:
+        with open(info_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _sha256_file(path):
+    """Return the hex SHA-256 digest of a file."""
+    with open(path, "rb") as fp:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fp, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fp.read(1 << 18), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+@functools.lru_cache(maxsize=1)
 def ensure_ffmpeg():
     """
     Ensure that ffmpeg.exe exists in the 'scripts' directory relative to this script.
     If not found, download and extract it from a prebuilt Windows release.
+    A previously downloaded copy is revalidated with a conditional GET so a new
+    build is only fetched when the server reports a change.
+    The archive is checked against the SHA-256 published next to it, and if the
+    FFMPEG_SHA256 environment variable is set, ffmpeg.exe must match that digest.
+    The result is memoized for the session; call ensure_ffmpeg.cache_clear()
+    to check again.
     Returns the path to ffmpeg.exe or None on failure.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    ffmpeg_dir = os.path.join(script_dir, "scripts")
-    ffmpeg_path = os.path.join(ffmpeg_dir, "ffmpeg.exe")
-    
+    ffmpeg_dir = _FFMPEG_DIR
+    ffmpeg_path = _FFMPEG_PATH
+    info_path = ffmpeg_path + ".etag"
+
+    headers = {}
+    cached_intact = False  # A previously downloaded binary of the recorded size is on disk
     if os.path.exists(ffmpeg_path):
-        return ffmpeg_path
+        if getattr(sys, 'frozen', False):
+            # PyInstaller bundles unpack to a throwaway temp dir, so an update
+            # could never be kept; always use the bundled binary.
+            return ffmpeg_path
+        cache_info = _read_ffmpeg_cache_info(info_path)
+        if cache_info is None:
+            # Bundled or manually installed binary; nothing to revalidate against.
+            return ffmpeg_path
+        # A size mismatch means a partial or corrupt binary, so it is re-downloaded.
+        cached_intact = cache_info.get("size") == os.path.getsize(ffmpeg_path)
+        if cached_intact:
+            if cache_info.get("etag"):
+                headers["If-None-Match"] = cache_info["etag"]
+            if cache_info.get("last_modified"):
+                headers["If-Modified-Since"] = cache_info["last_modified"]
+            if not headers:
+                # The server sent no validators, so there is no cheap way to check for updates.
+                return ffmpeg_path
 
     os.makedirs(ffmpeg_dir, exist_ok=True)
     
     # URL for the FFmpeg essentials build (from Gyan's builds)
     zip_url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
     try:
-        print("Downloading FFmpeg...")
-        response = requests.get(zip_url)
-        if response.status_code != 200:
-            raise Exception("Failed to download FFmpeg: status code " + str(response.status_code))
-        
-        with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-            candidate = None
-            for f in z.namelist():
-                if f.endswith("ffmpeg.exe") and ("bin/" in f or "bin\\" in f):
-                    candidate = f
-                    break
-            if candidate is None:
-                raise Exception("ffmpeg.exe not found in the downloaded zip archive.")
-            
-            z.extract(candidate, path=ffmpeg_dir)
-            extracted_path = os.path.join(ffmpeg_dir, candidate)
-            shutil.move(extracted_path, ffmpeg_path)
-            extracted_folder = os.path.join(ffmpeg_dir, candidate.split("/")[0])
-            if os.path.exists(extracted_folder):
-                shutil.rmtree(extracted_folder, ignore_errors=True)
+        # Stream the archive to a temporary file in 64 KiB chunks instead of
+        # holding the whole ~100 MB body in memory.
+        req = urllib.request.Request(zip_url, headers={"User-Agent": "Mozilla/5.0", **headers})
+        try:
+            response = urllib.request.urlopen(req, timeout=30)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return ffmpeg_path
+            raise
+        tmp = None
+        try:
+            with response:
+                tmp = tempfile.NamedTemporaryFile(delete=False, dir=ffmpeg_dir, suffix=".zip")
+                with tmp:
+                    print("Downloading FFmpeg...")
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    shutil.copyfileobj(response, tmp, 65536)
+
+            req = urllib.request.Request(zip_url + ".sha256", headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(req, timeout=30) as response:
+                expected_zip_sha256 = response.read().decode("ascii").split()[0].lower()
+            if _sha256_file(tmp.name) != expected_zip_sha256:
+                raise Exception("Downloaded FFmpeg archive failed the SHA-256 check.")
+
+            with zipfile.ZipFile(tmp.name) as z:
+                # Zip member names always use forward slashes
+                candidate = next((zi for zi in z.infolist() if zi.filename.endswith("/bin/ffmpeg.exe")), None)
+                if candidate is None:
+                    raise Exception("ffmpeg.exe not found in the downloaded zip archive.")
+
+                # Copy just the ffmpeg.exe member out of the archive, then move it
+                # into place atomically so a partial write never looks installed.
+                partial_path = ffmpeg_path + ".part"
+                try:
+                    with z.open(candidate) as src, open(partial_path, "wb", buffering=1 << 16) as dst:
+                        shutil.copyfileobj(src, dst, 1 << 16)
+                    expected_sha256 = os.environ.get("FFMPEG_SHA256")
+                    if expected_sha256 and _sha256_file(partial_path) != expected_sha256.strip().lower():
+                        raise Exception("ffmpeg.exe does not match FFMPEG_SHA256.")
+                    os.replace(partial_path, ffmpeg_path)
+                except BaseException:
+                    # Never leave a truncated or rejected binary behind
+                    if os.path.exists(partial_path):
+                        os.unlink(partial_path)
+                    raise
+        finally:
+            if tmp is not None:
+                os.unlink(tmp.name)
+
+        with open(info_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": os.path.getsize(ffmpeg_path),
+            }, f)
         print("FFmpeg downloaded and installed to:", ffmpeg_path)
         return ffmpeg_path
     except Exception as e:
+        if cached_intact:
+            # The cached binary is intact; keep using it if the update check fails.
+            print("Could not check for FFmpeg updates:", e)
+            return ffmpeg_path
         print("Error downloading FFmpeg:", e)
         return None
 
-class DownloadWorker(QThread):
-    progress = pyqtSignal(float)
-    finished = pyqtSignal(str)
+def _is_postprocessing_error(e):
+    """Return True if a yt-dlp error was caused by a postprocessor."""
+    # exc_info is (None, None, None) when the error wasn't raised from an except block
+    exc_info = getattr(e, 'exc_info', None)
+    exc_type = exc_info[0] if exc_info else None
+    return exc_type is not None and issubclass(exc_type, yt_dlp.utils.PostProcessingError)
+
+class EnsureFfmpegSignals(QObject):
+    done = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+class EnsureFfmpegTask(QRunnable):
+    """Runs ensure_ffmpeg() on the thread pool so the GUI stays responsive."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = EnsureFfmpegSignals()
+
+    def run(self):
+        ffmpeg_path = ensure_ffmpeg()
+        if ffmpeg_path is None:
+            # Don't memoize failures so the next click tries again
+            ensure_ffmpeg.cache_clear()
+            self.signals.failed.emit("FFmpeg could not be installed automatically.")
+        else:
+            self.signals.done.emit(ffmpeg_path)
+
+class InfoWorker(QThread):
+    info = pyqtSignal(str, object)  # (url, info dict)
     error = pyqtSignal(str)
 
-    def __init__(self, url, download_format, output_path, ffmpeg_path):
+    def __init__(self, ydl, urls):
+        super().__init__()
+        self.ydl = ydl
+        self.urls = urls
+
+    def run(self):
+        # The shared YoutubeDL isn't thread-safe, so URLs are fetched one at a time
+        for url in self.urls:
+            try:
+                info = self.ydl.extract_info(url, download=False)
+                self.info.emit(url, info)
+            except Exception as e:
+                prefix = url + ": " if len(self.urls) > 1 else ""
+                self.error.emit(prefix + str(e))
+
+class DownloadSignals(QObject):
+    # Each signal carries the job id of the DownloadRunnable that emitted it
+    progress = pyqtSignal(int, float)
+    finished = pyqtSignal(int, str)
+    error = pyqtSignal(int, str)
+    info_stale = pyqtSignal(str)  # url whose cached Fetch Info result failed
+
+class DownloadRunnable(QRunnable):
+    """Downloads a single URL on a QThreadPool."""
+
+    def __init__(self, job_id, url, download_format, output_path, ffmpeg_path, gpu_encode=False, fast_encode=False,
+                 info=None):
         super().__init__()
+        self.signals = DownloadSignals()
+        self.job_id = job_id
         self.url = url
         self.download_format = download_format
         self.output_path = output_path
         self.ffmpeg_path = ffmpeg_path
+        self.gpu_encode = gpu_encode  # Re-encode MP4 video with NVENC when available
+        self.fast_encode = fast_encode  # Favor speed over size on the libx264 path
+        self.info = info  # Info dict from Fetch Info, to skip re-extraction
         self.cancelled = False  # Cancellation flag
+        self._last_emit = 0.0  # time.monotonic() of the last progress emit
+        self._last_percent = -1  # Integer percent of the last progress emit
 
     def cancel(self):
         self.cancelled = True
@@ -79,8 +273,21 @@ class DownloadWorker(QThread):
             'outtmpl': os.path.join(self.output_path, '%(title)s.%(ext)s'),
             'progress_hooks': [self.my_hook],
             'quiet': True,
-            'ffmpeg_location': self.ffmpeg_path
+            'ffmpeg_location': self.ffmpeg_path,
+            # Small range requests sidestep per-connection throttling, and
+            # DASH/HLS fragments are fetched in parallel
+            'http_chunk_size': 10 << 20,
+            'concurrent_fragment_downloads': 4,
+            'retries': 10,
+            'fragment_retries': 10,
+            # Start reading in 64 KiB blocks; yt-dlp still resizes the block
+            # each iteration (up to 4 MiB) based on throughput
+            'buffersize': 1 << 16,
         }
+        if self.output_path.startswith(('\\\\', '//')):
+            # Network shares (UNC paths) can briefly lock files while writing;
+            # retry more often than yt-dlp's default of 10
+            ydl_opts['file_access_retries'] = 20
         if self.download_format == 'mp3':
             ydl_opts.update({
                 'format': 'bestaudio/best',
@@ -89,37 +296,103 @@ class DownloadWorker(QThread):
                     'preferredcodec': 'mp3',
                     'preferredquality': '192',
                 }],
+                # libmp3lame is single-threaded; extra threads only add overhead
+                'postprocessor_args': {'extractaudio': ['-threads', '1']},
             })
         elif self.download_format == 'mp4':
             ydl_opts.update({
                 'format': 'bestvideo+bestaudio/best',
                 'merge_output_format': 'mp4',
             })
+            if self.gpu_encode:
+                # The merger stream-copies by default; override the video codec
+                # so the video is re-encoded while merging.
+                ydl_opts['postprocessor_args'] = self._video_postprocessor_args()
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([self.url])
-            self.finished.emit("Download finished!")
+            try:
+                self._run_ydl(ydl_opts)
+            except yt_dlp.utils.DownloadError as e:
+                pp_args = ydl_opts.get('postprocessor_args', {})
+                if self.cancelled or 'merger+ffmpeg_i1' not in pp_args:
+                    raise
+                if not _is_postprocessing_error(e):
+                    raise
+                # CUDA decoding or NVENC failed (e.g. unsupported source codec);
+                # redo the merge in software, reusing the downloaded streams.
+                ydl_opts['postprocessor_args'] = {'merger': self._software_video_args()}
+                self._run_ydl(ydl_opts)
+            self.signals.finished.emit(self.job_id, "Download finished!")
+        except yt_dlp.utils.DownloadCancelled:
+            self.signals.finished.emit(self.job_id, "Download cancelled.")
         except Exception as e:
-            if "Download cancelled by user" in str(e):
-                self.finished.emit("Download cancelled.")
-            else:
-                self.error.emit(str(e))
+            self.signals.error.emit(self.job_id, str(e))
+
+    def _run_ydl(self, ydl_opts):
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if self.info is not None:
+                # Same as --load-info-json: strip processing state from a copy
+                # and let this YoutubeDL redo format selection and download.
+                # If the cached media URLs have expired, extract again.
+                try:
+                    ydl.process_ie_result(ydl.sanitize_info(self.info, True), download=True)
+                    return
+                except _REEXTRACT_ERRORS as e:
+                    if self.cancelled or _is_postprocessing_error(e):
+                        raise
+                self.info = None
+                self.signals.info_stale.emit(self.url)
+            ydl.download([self.url])
+
+    def _video_postprocessor_args(self):
+        for encoder, args in NVENC_ENCODERS.items():
+            if ffmpeg_can_encode(self.ffmpeg_path, encoder):
+                return {
+                    'merger': ['-c:v', encoder] + args,
+                    # Only the first merger input is the video stream
+                    'merger+ffmpeg_i1': CUDA_DECODE_ARGS,
+                }
+        return {'merger': self._software_video_args()}
+
+    def _software_video_args(self):
+        # Use every core for the libx264 slice/frame threads
+        args = ['-c:v', 'libx264', '-threads', str(os.cpu_count() or 4)]
+        if self.fast_encode:
+            args += ['-preset', 'ultrafast', '-tune', 'zerolatency']
+        return args
 
     def my_hook(self, d):
         if self.cancelled:
-            # Raise an exception to cancel the download gracefully
-            raise Exception("Download cancelled by user.")
+            # yt-dlp's own cancellation exception aborts the download cleanly
+            raise yt_dlp.utils.DownloadCancelled("Download cancelled by user.")
         if d.get('status') == 'downloading':
             total = d.get('total_bytes') or d.get('total_bytes_estimate')
             if total:
                 progress_value = d.get('downloaded_bytes', 0) / total * 100
-                self.progress.emit(progress_value)
+                # Throttle to ~10 Hz unless the integer percent changed
+                now = time.monotonic()
+                percent = int(progress_value)
+                if now - self._last_emit >= 0.1 or percent != self._last_percent:
+                    self._last_emit = now
+                    self._last_percent = percent
+                    self.signals.progress.emit(self.job_id, progress_value)
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
-        self.worker = None  # To hold the current download thread
+        self.jobs = {}  # job id -> active DownloadRunnable
+        self._job_progress = {}  # job id -> percent, for every job in the current batch
+        self._next_job_id = 0
+        self.download_pool = QThreadPool(self)
+        self.download_pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+        self._ffmpeg_validated = None  # (path, mtime, size) of the last ffmpeg that passed the check
+        self._ffmpeg_task = None  # Pending EnsureFfmpegTask, if any
+        self._info_ydl = None  # Shared YoutubeDL for Fetch Info, created on first use
+        self._info_cache = {}  # url -> (time.monotonic() when fetched, info dict)
+        self.info_worker = None  # To hold the current info thread
+        self._progress_int = -1  # Last integer value shown in the progress bar
+        self._progress_decile = -1  # Last 10% step written to the log
+        self.settings = QSettings("jemmonsss", "Youtube-MP4-MP3-Extractor")
         self.setWindowTitle("Media Downloader")
         self.setGeometry(300, 300, 600, 450)
         self.setup_ui()
@@ -141,6 +414,13 @@ class MainWindow(QWidget):
         format_layout.addWidget(QLabel("Select Format:"))
         format_layout.addWidget(self.mp3_radio)
         format_layout.addWidget(self.mp4_radio)
+        self.gpu_checkbox = QCheckBox("GPU encoding (NVENC)")
+        self.gpu_checkbox.setToolTip("Re-encode MP4 video to H.264 on an NVIDIA GPU (falls back to libx264)")
+        format_layout.addWidget(self.gpu_checkbox)
+        self.fast_checkbox = QCheckBox("Fast")
+        self.fast_checkbox.setToolTip("With GPU encoding on, use the ultrafast x264 preset if it falls back "
+                                      "to libx264 on the CPU (larger files)")
+        format_layout.addWidget(self.fast_checkbox)
         layout.addLayout(format_layout)
 
         # Output Directory
@@ -178,10 +458,21 @@ class MainWindow(QWidget):
         # Log Output
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.document().setMaximumBlockCount(2000)
+        self._progress_line = False  # Whether the last log line is a progress line
         layout.addWidget(self.log_output)
 
         self.setLayout(layout)
 
+        # Restore encoding options from the previous session
+        self.gpu_checkbox.setChecked(self.settings.value("gpu_encode", False, type=bool))
+        self.fast_checkbox.setChecked(self.settings.value("fast_encode", False, type=bool))
+        self.gpu_checkbox.toggled.connect(lambda checked: self.settings.setValue("gpu_encode", checked))
+        self.fast_checkbox.toggled.connect(lambda checked: self.settings.setValue("fast_encode", checked))
+        # Fast only affects the libx264 fallback of GPU encoding
+        self.fast_checkbox.setEnabled(self.gpu_checkbox.isChecked())
+        self.gpu_checkbox.toggled.connect(self.fast_checkbox.setEnabled)
+
         # Modern black and purple-themed stylesheet
         self.setStyleSheet("""
             QWidget {
@@ -211,73 +502,185 @@ class MainWindow(QWidget):
             }
         """)
 
+    def _log(self, msg, progress=False):
+        """
+        Write a line to the log. Consecutive progress lines overwrite each other
+        instead of growing the log.
+        """
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        cursor = QTextCursor(self.log_output.document())
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.End)
+        if progress and self._progress_line:
+            cursor.movePosition(QTextCursor.StartOfBlock, QTextCursor.KeepAnchor)
+        elif not self.log_output.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(msg)
+        cursor.endEditBlock()
+        self._progress_line = progress
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Download Folder", self.out_path.text())
         if folder:
             self.out_path.setText(folder)
 
     def start_download(self):
-        self.log_output.append("Checking for FFmpeg in the scripts directory...")
-        ffmpeg_path = ensure_ffmpeg()
-        if ffmpeg_path is None:
-            self.log_output.append("Error: FFmpeg could not be installed automatically.")
+        if self._ffmpeg_task is not None:
             return
+        if self.jobs:
+            self._log("A download is already in progress.")
+            return
+        self._log("Checking for FFmpeg in the scripts directory...")
+        self.download_button.setEnabled(False)
+        self._ffmpeg_task = EnsureFfmpegTask()
+        self._ffmpeg_task.signals.done.connect(self._on_ffmpeg_ready)
+        self._ffmpeg_task.signals.failed.connect(self._on_ffmpeg_failed)
+        QThreadPool.globalInstance().start(self._ffmpeg_task)
+
+    def _on_ffmpeg_failed(self, error_message):
+        self._ffmpeg_task = None
+        self.download_button.setEnabled(True)
+        self._log("Error: " + error_message)
+
+    def _on_ffmpeg_ready(self, ffmpeg_path):
+        self._ffmpeg_task = None
+        self.download_button.setEnabled(True)
 
         try:
-            subprocess.run([ffmpeg_path, "-version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-            self.log_output.append("FFmpeg check passed using the scripts directory.")
+            # Only spawn "ffmpeg -version" when the binary changed since the last passing check
+            key = (ffmpeg_path, os.path.getmtime(ffmpeg_path), os.path.getsize(ffmpeg_path))
+            if key != self._ffmpeg_validated:
+                subprocess.run([ffmpeg_path, "-version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+                self._ffmpeg_validated = key
+            self._log("FFmpeg check passed using the scripts directory.")
         except Exception as e:
-            self.log_output.append("Error: FFmpeg is not accessible from the scripts directory. " + str(e))
+            self._ffmpeg_validated = None
+            ensure_ffmpeg.cache_clear()
+            self._log("Error: FFmpeg is not accessible from the scripts directory. " + str(e))
             return
 
-        url = self.url_input.text().strip()
-        if not url:
-            self.log_output.append("Please enter a valid URL.")
+        # Several URLs may be entered separated by spaces or newlines
+        urls = self.url_input.text().split()
+        if not urls:
+            self._log("Please enter a valid URL.")
             return
 
         download_format = 'mp3' if self.mp3_radio.isChecked() else 'mp4'
         output_path = self.out_path.text().strip()
 
-        self.worker = DownloadWorker(url, download_format, output_path, ffmpeg_path)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.download_finished)
-        self.worker.error.connect(self.download_error)
-        self.worker.start()
-        self.log_output.append("Starting download...")
+        self._progress_int = -1
+        self._progress_decile = -1
+        self._job_progress = {}
+        gpu_encode = self.gpu_checkbox.isChecked()
+        fast_encode = self.fast_checkbox.isEnabled() and self.fast_checkbox.isChecked()
+        for url in urls:
+            info = None
+            cached = self._info_cache.get(url)
+            if cached and time.monotonic() - cached[0] < INFO_CACHE_TTL:
+                info = cached[1]
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            job = DownloadRunnable(job_id, url, download_format, output_path, ffmpeg_path, gpu_encode, fast_encode,
+                                   info)
+            job.signals.progress.connect(self.job_progress)
+            job.signals.finished.connect(self.download_finished)
+            job.signals.error.connect(self.download_error)
+            job.signals.info_stale.connect(self.info_stale)
+            self.jobs[job_id] = job
+            self._job_progress[job_id] = 0.0
+            self.download_pool.start(job)
+        if len(urls) > 1:
+            self._log(f"Starting {len(urls)} downloads...")
+        else:
+            self._log("Starting download...")
 
     def cancel_download(self):
-        if self.worker and self.worker.isRunning():
-            self.worker.cancel()  # Set the cancellation flag
-            self.log_output.append("Cancelling download...")
+        if self.jobs:
+            self._log("Cancelling download...")
+            for job_id, job in list(self.jobs.items()):
+                if self.download_pool.tryTake(job):
+                    # Still queued; it never started, so it is done right away
+                    self.download_finished(job_id, "Download cancelled.")
+                else:
+                    job.cancel()  # Set the cancellation flag
         else:
-            self.log_output.append("No active download to cancel.")
+            self._log("No active download to cancel.")
+
+    def closeEvent(self, event):
+        # Drop queued downloads and stop running ones, otherwise the pool keeps
+        # the process alive in the background until the whole batch finishes
+        self.download_pool.clear()
+        for job in self.jobs.values():
+            job.cancel()
+        event.accept()
 
     def fetch_info(self):
-        url = self.url_input.text().strip()
-        if not url:
-            self.log_output.append("Please enter a valid URL to fetch info.")
+        # Same whitespace-separated URLs as start_download, so the info cache keys match
+        urls = self.url_input.text().split()
+        if not urls:
+            self._log("Please enter a valid URL to fetch info.")
             return
-        try:
-            self.log_output.append("Fetching video info...")
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-            title = info.get('title', 'N/A')
-            uploader = info.get('uploader', 'N/A')
-            duration = info.get('duration', 0)
-            self.log_output.append(f"Title: {title}\nUploader: {uploader}\nDuration: {duration} seconds")
-        except Exception as e:
-            self.log_output.append("Error fetching info: " + str(e))
+        if self.info_worker and self.info_worker.isRunning():
+            self._log("Already fetching video info...")
+            return
+        if self._info_ydl is None:
+            self._info_ydl = yt_dlp.YoutubeDL({'quiet': True, 'skip_download': True})
+        self._log("Fetching video info...")
+        self.info_worker = InfoWorker(self._info_ydl, urls)
+        self.info_worker.info.connect(self.info_fetched)
+        self.info_worker.error.connect(self.info_error)
+        self.info_worker.start()
+
+    def info_stale(self, url):
+        self._info_cache.pop(url, None)
+
+    def info_fetched(self, url, info):
+        if info.get('_type', 'video') == 'video':
+            # sanitize_info() drops playlist entries, so only single videos are reused
+            self._info_cache[url] = (time.monotonic(), info)
+        title = info.get('title') or 'N/A'
+        uploader = info.get('uploader') or 'N/A'
+        duration = int(info.get('duration') or 0)
+        self._log(f"Title: {title}\nUploader: {uploader}\nDuration: {duration} seconds")
+
+    def info_error(self, error_message):
+        self._log("Error fetching info: " + error_message)
 
     def update_progress(self, value):
-        self.progress_bar.setValue(int(value))
-        self.log_output.append(f"Download progress: {value:.2f}%")
+        percent = int(value)
+        if percent != self._progress_int:
+            self._progress_int = percent
+            self.progress_bar.setValue(percent)
+        # Only log when crossing a 10% step (in either direction, e.g. when the
+        # audio stream starts after the video stream)
+        decile = percent // 10
+        if decile != self._progress_decile:
+            self._progress_decile = decile
+            self._log(f"Download progress: {value:.2f}%", progress=True)
+
+    def job_progress(self, job_id, value):
+        # The progress bar shows the average over every job in the batch
+        self._job_progress[job_id] = value
+        self.update_progress(sum(self._job_progress.values()) / len(self._job_progress))
+
+    def _finish_job(self, job_id):
+        """Forget a finished job and return the log prefix identifying it."""
+        job = self.jobs.pop(job_id, None)
+        if job is None or len(self._job_progress) == 1:
+            return ""
+        return job.url + ": "
 
-    def download_finished(self, message):
-        self.log_output.append(message)
-        self.progress_bar.setValue(100)
+    def download_finished(self, job_id, message):
+        self._log(self._finish_job(job_id) + message)
+        self._job_progress[job_id] = 100.0
+        if not self.jobs:
+            self.progress_bar.setValue(100)
 
-    def download_error(self, error_message):
-        self.log_output.append("Error: " + error_message)
+    def download_error(self, job_id, error_message):
+        self._log("Error: " + self._finish_job(job_id) + error_message)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)